@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+import argparse
+import gc
+import platform
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import calculate
+
+
+def peak_resident():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if platform.system() == 'Darwin' else peak * 1024
+
+
+def measure(count):
+    parser = calculate.DefaultParser()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    peak = peak_resident()
+
+    expressions = [
+        parser.from_infix(f'x * {index} + sin(y)', ['x', 'y'])
+        for index in range(count)
+    ]
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    python = (after - before) / count
+    if peak is not None:
+        peak = (peak_resident() - peak) / count
+    return len(expressions), python, peak
+
+
+if __name__ == '__main__':
+    arguments = argparse.ArgumentParser(
+        description='Bytes per live Expression'
+    )
+    arguments.add_argument('-n', '--count', type=int, default=100000)
+    count, python, peak = measure(arguments.parse_args().count)
+    print(f'live expressions: {count}')
+    print(f'python bytes per expression: {python:.1f}')
+    if peak is None:
+        print('peak resident growth per expression: unavailable')
+    else:
+        print(f'peak resident growth per expression: {peak:.1f}')
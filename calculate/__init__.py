@@ -1,4 +1,4 @@
-from calculate.calculate import Symbol, Associativity
+from calculate.calculate import Symbol, Associativity, scope, live
 from calculate.lexer import Lexer
-from calculate.expression import Expression
+from calculate.expression import Expression, ExpressionGroup, CachedExpression
 from calculate.parser import Parser, DefaultParser
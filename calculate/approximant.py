@@ -0,0 +1,141 @@
+from array import array
+
+import math
+import time
+
+import calculate.buffer as buffer
+
+__all__ = ['Approximant', 'chebyshev']
+
+
+class Approximant:
+
+    __slots__ = (
+        '_coefficients',
+        '_domain',
+        '_error',
+        '_speedup',
+        '_variables'
+    )
+
+    def __init__(self, coefficients, domain, error, speedup, variables):
+        self._coefficients = tuple(coefficients)
+        self._domain = tuple(domain)
+        self._error = error
+        self._speedup = speedup
+        self._variables = list(variables)
+
+    def __call__(self, x):
+        a, b = self._domain
+        if not a <= x <= b:
+            raise ValueError(f'{x} outside of domain [{a}, {b}]')
+        t = (2 * x - a - b) / (b - a)
+        b1, b2 = 0., 0.
+        for coefficient in reversed(self._coefficients[1:]):
+            b1, b2 = 2 * t * b1 - b2 + coefficient, b1
+        return t * b1 - b2 + self._coefficients[0]
+
+    def __repr__(self):
+        name = self.__class__.__name__
+        return (
+            f"<{name} {{"
+            f"'domain': {self._domain}, "
+            f"'degree': {self.degree}, "
+            f"'error': {self._error}, "
+            f"'speedup': {self._speedup}"
+            f"}}>"
+        )
+
+    @property
+    def coefficients(self):
+        return self._coefficients
+
+    @property
+    def domain(self):
+        return self._domain
+
+    @property
+    def degree(self):
+        return len(self._coefficients) - 1
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def speedup(self):
+        return self._speedup
+
+    @property
+    def variables(self):
+        return list(self._variables)
+
+    def map(self, *arrays, out=None):
+        if len(arrays) != 1:
+            name = self.__class__.__name__
+            raise TypeError(
+                f"{name}.map() takes 1 buffer but {len(arrays)} were given"
+            )
+        return buffer.apply(self, arrays, out)
+
+
+def _fit(values):
+    n = len(values)
+    coefficients = [
+        2 / n * math.fsum(
+            value * math.cos(math.pi * j * (k + .5) / n)
+            for k, value in enumerate(values)
+        )
+        for j in range(n)
+    ]
+    coefficients[0] /= 2
+    return coefficients
+
+
+def _chop(coefficients, tolerance):
+    tail = 0.
+    for index in range(len(coefficients) - 1, 0, -1):
+        tail += abs(coefficients[index])
+        if tail > tolerance / 4:
+            return coefficients[:index + 1]
+    return coefficients[:1]
+
+
+def chebyshev(function, domain, tolerance, degree=256):
+    a, b = domain
+    if not a < b:
+        raise ValueError(f'Empty domain [{a}, {b}]')
+    if degree < 0:
+        raise ValueError(f'Negative degree {degree}')
+    n = min(8, degree + 1)
+    while True:
+        nodes = array('d', (
+            (b - a) / 2 * math.cos(math.pi * (k + .5) / n) + (a + b) / 2
+            for k in range(n)
+        ))
+        coefficients = _chop(_fit(function.map(nodes).tolist()), tolerance)
+        approximant = Approximant(
+            coefficients, domain, math.inf, 1., function.variables
+        )
+
+        samples = array('d', (
+            min(a + (b - a) * i / (4 * n), b) for i in range(4 * n + 1)
+        ))
+        start = time.perf_counter()
+        exact = function.map(samples)
+        middle = time.perf_counter()
+        approximated = approximant.map(samples)
+        end = time.perf_counter()
+
+        error = max(abs(x - y) for x, y in zip(exact, approximated))
+        if error <= tolerance:
+            speedup = (middle - start) / max(end - middle, 1e-12)
+            return Approximant(
+                coefficients, domain, error, speedup, function.variables
+            )
+        if n > degree:
+            raise ValueError(
+                f'Tolerance {tolerance} not reached up to degree {degree},'
+                f' best error {error}'
+            )
+        n = min(2 * n, degree + 1)
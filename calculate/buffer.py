@@ -0,0 +1,202 @@
+from array import array
+from operator import eq, ge, gt, le, lt, mul, ne
+
+import functools
+import math
+import sys
+
+__all__ = [
+    'doubles',
+    'allocate',
+    'size',
+    'conform',
+    'evaluate',
+    'apply',
+    'grid',
+    'reduce'
+]
+
+NATIVE = {'d', '@d', '=d', ('<' if sys.byteorder == 'little' else '>') + 'd'}
+
+
+def doubles(buffer, writable=False):
+    view = memoryview(buffer)
+    if view.format not in NATIVE:
+        raise TypeError(f"Buffer of doubles expected, got '{view.format}'")
+    if writable and view.readonly:
+        raise TypeError('Writable buffer expected')
+    if not view.nbytes:
+        return memoryview(array('d'))
+    if view.ndim != 1 or view.format != 'd':
+        view = view.cast('B').cast('d')
+    return view
+
+
+def allocate(size, shape=None):
+    buffer = memoryview(array('d', bytes(8 * size)))
+    return buffer.cast('B').cast('d', shape) if shape and size else buffer
+
+
+def size(views):
+    sizes = {len(view) for view in views}
+    if len(sizes) > 1:
+        raise ValueError(f'Buffers of mismatched sizes: {sorted(sizes)}')
+    return sizes.pop() if sizes else 1
+
+
+def conform(out, shape):
+    points = functools.reduce(mul, shape, 1)
+    allowed = {shape} if shape and points else {shape, (points,)}
+    if memoryview(out).shape not in allowed:
+        raise ValueError(
+            f'Output buffer of shape {memoryview(out).shape}'
+            f' but shape {shape} is needed'
+        )
+
+
+def evaluate(function, views):
+    if views:
+        for values in zip(*views):
+            yield function(*values)
+    else:
+        yield function()
+
+
+def apply(function, arrays, out=None):
+    views = [doubles(buffer) for buffer in arrays]
+    out = allocate(size(views)) if out is None else out
+    output = doubles(out, writable=True)
+    if len(output) != size(views):
+        raise ValueError(
+            f'Output buffer holds {len(output)} values'
+            f' but {size(views)} are needed'
+        )
+    for index, value in enumerate(evaluate(function, views)):
+        output[index] = value
+    return out
+
+
+def _product(views):
+    if not views:
+        yield ()
+        return
+    for value in views[0]:
+        for values in _product(views[1:]):
+            yield (value, *values)
+
+
+def grid(function, axes, out=None):
+    views = []
+    for axis in axes:
+        if memoryview(axis).ndim != 1:
+            raise ValueError('Grid axes must be one-dimensional')
+        views.append(doubles(axis))
+    shape = tuple(len(view) for view in views)
+    points = functools.reduce(mul, shape, 1)
+    out = allocate(points, shape) if out is None else out
+    conform(out, shape)
+    output = doubles(out, writable=True)
+    for index, values in enumerate(_product(views)):
+        output[index] = function(*values)
+    return out
+
+
+def _sum(values, test, compensated):
+    if not compensated:
+        return sum(values, 0.)
+    special = 0.
+
+    def finite():
+        nonlocal special
+        for value in values:
+            if math.isfinite(value):
+                yield value
+            else:
+                special += value
+
+    total = math.fsum(finite())
+    return total + special if special else total
+
+
+def _mean(values, test, compensated):
+    count = 0
+
+    def counter():
+        nonlocal count
+        for value in values:
+            count += 1
+            yield value
+
+    total = _sum(counter(), test, compensated)
+    if not count:
+        raise ValueError('Mean of an empty sequence')
+    return total / count
+
+
+def _extreme(values, better):
+    index, best = -1, None
+    for position, value in enumerate(values):
+        if math.isnan(value):
+            return position, value
+        if best is None or better(value, best):
+            index, best = position, value
+    if best is None:
+        raise ValueError('Extreme of an empty sequence')
+    return index, best
+
+
+COMPARISONS = {
+    '>': gt,
+    '>=': ge,
+    '<': lt,
+    '<=': le,
+    '==': eq,
+    '!=': ne
+}
+
+REDUCTIONS = {
+    'sum': _sum,
+    'mean': _mean,
+    'min': lambda values, test, compensated: _extreme(values, lt)[1],
+    'max': lambda values, test, compensated: _extreme(values, gt)[1],
+    'argmin': lambda values, test, compensated: _extreme(values, lt)[0],
+    'argmax': lambda values, test, compensated: _extreme(values, gt)[0],
+    'any': lambda values, test, compensated: any(map(test, values)),
+    'all': lambda values, test, compensated: all(map(test, values))
+}
+
+
+COMPENSATED = {'sum', 'mean'}
+THRESHOLDED = {'any', 'all'}
+
+
+def reduce(
+        operation, values, threshold=None, compensated=False, comparison=None
+):
+    if operation not in REDUCTIONS:
+        raise ValueError(
+            f"Unknown reduction '{operation}',"
+            f" expected one of {sorted(REDUCTIONS)}"
+        )
+    if compensated and operation not in COMPENSATED:
+        raise ValueError(f"Reduction '{operation}' cannot be compensated")
+    if operation not in THRESHOLDED and (
+            threshold is not None or comparison is not None
+    ):
+        raise ValueError(f"Reduction '{operation}' takes no threshold")
+    if threshold is None and comparison is not None:
+        raise ValueError('Comparison given without a threshold')
+    if threshold is None:
+        test = bool
+    else:
+        comparison = '>' if comparison is None else comparison
+        if comparison not in COMPARISONS:
+            raise ValueError(
+                f"Unknown comparison '{comparison}',"
+                f" expected one of {sorted(COMPARISONS)}"
+            )
+        compare = COMPARISONS[comparison]
+
+        def test(value):
+            return compare(value, threshold)
+    return REDUCTIONS[operation](values, test, compensated)
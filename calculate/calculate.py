@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import Counter, defaultdict
 from enum import Enum, unique
 from types import ModuleType, MethodType
 from abc import ABC, abstractmethod
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 import sys
 import inspect
 import textwrap
+import threading
+import weakref
 import re
 
 from calculate._calculate import ffi, lib
@@ -89,20 +91,38 @@ class Associativity(Enum):
 
 class Handler:
 
+    __slots__ = ('_handler', '_kind', '_free', '__weakref__')
+
+    _live = Counter()
+
     def __init__(self, handler, kind):
         self._handler = handler
         self._kind = kind
         self._free = getattr(calculate, f'free_{kind}')
+        Handler._live[kind] += 1
+        Scope.register(self)
 
     def __del__(self):
-        self._free(self)
+        self.close()
 
     def __repr__(self):
         name = self.__class__.__name__
         return f"<{name} {{'kind': {self._kind.title()}}}>"
 
+    def close(self):
+        if self._handler is not None:
+            self._free(self)
+            self._handler = None
+            Handler._live[self._kind] -= 1
+
+    @property
+    def closed(self):
+        return self._handler is None
+
     @property
     def handler(self):
+        if self._handler is None:
+            raise ValueError('Operation on closed resource handler')
         return self._handler
 
     @property
@@ -110,6 +130,64 @@ class Handler:
         return self._kind
 
 
+class Scope:
+
+    __slots__ = ('_handlers',)
+
+    _local = threading.local()
+
+    def __init__(self):
+        self._handlers = weakref.WeakSet()
+
+    def __enter__(self):
+        self._stack().append(self)
+        return self
+
+    def __exit__(self, *args):
+        self._stack().remove(self)
+        self.close()
+        return False
+
+    def __repr__(self):
+        name = self.__class__.__name__
+        return f"<{name} {{'live': {self.live}}}>"
+
+    @classmethod
+    def _stack(cls):
+        if not hasattr(cls._local, 'stack'):
+            cls._local.stack = []
+        return cls._local.stack
+
+    @classmethod
+    def active(cls):
+        return bool(cls._stack())
+
+    @classmethod
+    def register(cls, handler):
+        stack = cls._stack()
+        if stack:
+            stack[-1]._handlers.add(handler)
+
+    def close(self):
+        for handler in list(self._handlers):
+            handler.close()
+        self._handlers.clear()
+
+    @property
+    def live(self):
+        return dict(Counter(
+            handler.kind for handler in self._handlers if not handler.closed
+        ))
+
+
+def scope():
+    return Scope()
+
+
+def live():
+    return {kind: count for kind, count in Handler._live.items() if count}
+
+
 class LibraryManager(ModuleType):
 
     def __new__(cls, name):
@@ -210,15 +288,37 @@ class LibraryManager(ModuleType):
 
 class ManagedClass(ABC):
 
+    __slots__ = ('_handler',)
+
     @abstractmethod
     def __init__(self, handler):
-        self._handler = handler
-        if not getattr(calculate, f'check_{handler.kind}')(self._handler):
+        self._handler = self._check(handler)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    @staticmethod
+    def _check(handler):
+        if not getattr(calculate, f'check_{handler.kind}')(handler):
             raise ValueError('Invalid resource handler')
+        return handler
+
+    def close(self):
+        self._handler.close()
+
+    @property
+    def closed(self):
+        return self._handler.closed
 
 
 class Error(ManagedClass):
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(calculate.get_error())
 
@@ -226,10 +326,13 @@ class Error(ManagedClass):
         return self._handler
 
     def __exit__(self, *args):
-        if args[0]:
-            return False
-        elif calculate.status(self._handler):
-            exception.throw(calculate.message(self._handler))
+        try:
+            if args[0]:
+                return False
+            elif calculate.status(self._handler):
+                exception.throw(calculate.message(self._handler))
+        finally:
+            self.close()
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -253,6 +356,9 @@ calculate = LibraryManager(__name__)
 setattr(calculate, 'Symbol', Symbol)
 setattr(calculate, 'Associativity', Associativity)
 setattr(calculate, 'Handler', Handler)
+setattr(calculate, 'Scope', Scope)
+setattr(calculate, 'scope', scope)
+setattr(calculate, 'live', live)
 setattr(calculate, 'ManagedClass', ManagedClass)
 setattr(calculate, 'Error', Error)
 sys.modules[__name__] = calculate
@@ -1,19 +1,25 @@
-from collections import Iterable, Iterator
-from types import MethodType
+from collections import Iterable, Iterator, OrderedDict
 
-import functools
+import struct
+import weakref
 
 from calculate.calculate import ManagedClass
 
+from calculate.approximant import chebyshev
+
+import calculate.buffer as buffer
 import calculate.calculate as calculate
+import calculate.profiler as profiler
 
-__all__ = ['Expression']
+__all__ = ['Expression', 'ExpressionGroup', 'CachedExpression']
 
 
 class Expression(ManagedClass):
 
     class ExpressionIterator(Iterator):
 
+        __slots__ = ('_nodes', '_branches', '_branch', '_cache')
+
         def __init__(self, nodes, branches, cache):
             self._nodes = nodes
             self._branches = branches
@@ -23,7 +29,7 @@ class Expression(ManagedClass):
         def __next__(self):
             if self._branch == self._branches:
                 raise StopIteration
-            expression = Expression(
+            expression = Expression.intern(
                 calculate.get_node(self._nodes, self._branch),
                 self._cache
             )
@@ -39,35 +45,40 @@ class Expression(ManagedClass):
                 f"}}>"
             )
 
+    __slots__ = ('_cache', '_arguments', '__weakref__')
+
+    _interned = weakref.WeakValueDictionary()
+
     def __init__(self, handler, cache):
         super().__init__(handler)
-        self._error = calculate.Error()
-        self._cache = cache
+        self._setup(cache, calculate.variables(self._handler))
 
-        evaluate = {
-            0: lambda self:
-                calculate.evaluate_expression(self._handler, 0, 0., 0., 0.),
-            1: lambda self, x0:
-                calculate.evaluate_expression(self._handler, 1, x0, 0., 0.),
-            2: lambda self, x0, x1:
-                calculate.evaluate_expression(self._handler, 2, x0, x1, 0.),
-            3: lambda self, x0, x1, x2:
-                calculate.evaluate_expression(self._handler, 3, x0, x1, x2)
-        }[len(self.variables)]
-        evaluate = MethodType(functools.wraps(self._evaluate)(evaluate), self)
-        setattr(self, '_evaluate', evaluate)
+    def _setup(self, cache, variables):
+        self._cache = cache
+        self._arguments = len(variables.split(',')) if variables else 0
 
     def __call__(self, *args):
-        return self._evaluate(*args)
+        if len(args) != self._arguments:
+            name = self.__class__.__name__
+            raise TypeError(
+                f"{name}() takes {self._arguments} positional arguments"
+                f" but {len(args)} were given"
+            )
+        return calculate.evaluate_expression(
+            self._handler,
+            len(args),
+            *args,
+            *(0.,) * (3 - len(args))
+        )
 
     def __float__(self):
-        return self._evaluate()
+        return self()
 
     def __hash__(self):
         return calculate.hash(self._handler)
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             isinstance(other, self.__class__) and
             bool(calculate.equal(self._handler, other._handler))
         )
@@ -79,7 +90,7 @@ class Expression(ManagedClass):
         name = self.__class__.__name__
         if index >= len(self):
             raise IndexError(f'{name} index out of range')
-        return Expression(
+        return Expression.intern(
             calculate.get_node(calculate.nodes(self._handler), index),
             self._cache
         )
@@ -100,8 +111,79 @@ class Expression(ManagedClass):
             f"}}>"
         )
 
-    def _evaluate(self):
-        pass
+    def map(self, *arrays, out=None):
+        if len(arrays) != self._arguments:
+            name = self.__class__.__name__
+            raise TypeError(
+                f"{name}.map() takes {self._arguments} buffers"
+                f" but {len(arrays)} were given"
+            )
+        return buffer.apply(self, arrays, out)
+
+    def evaluate_grid(self, *axes, out=None):
+        if len(axes) != self._arguments:
+            name = self.__class__.__name__
+            raise TypeError(
+                f"{name}.evaluate_grid() takes {self._arguments} axes"
+                f" but {len(axes)} were given"
+            )
+        return buffer.grid(self, axes, out)
+
+    def approximate(self, domain, tolerance, degree=256):
+        if self._arguments != 1:
+            raise ValueError(
+                f'Only univariate expressions can be approximated,'
+                f' found {self.variables}'
+            )
+        return chebyshev(self, domain, tolerance, degree)
+
+    def cached(self, maxsize=128):
+        return CachedExpression(self, maxsize)
+
+    def profile(self, *args, repeat=1000):
+        return profiler.profile(self, args, repeat)
+
+    def reduce(
+            self, operation, *arrays,
+            threshold=None, compensated=False, comparison=None
+    ):
+        if len(arrays) != self._arguments:
+            name = self.__class__.__name__
+            raise TypeError(
+                f"{name}.reduce() takes {self._arguments} buffers"
+                f" but {len(arrays)} were given"
+            )
+        views = [buffer.doubles(array) for array in arrays]
+        buffer.size(views)
+        return buffer.reduce(
+            operation,
+            buffer.evaluate(self, views),
+            threshold,
+            compensated,
+            comparison
+        )
+
+    @classmethod
+    def _wrap(cls, handler, cache, variables):
+        expression = cls.__new__(cls)
+        expression._handler = handler
+        expression._setup(cache, variables)
+        return expression
+
+    @classmethod
+    def intern(cls, handler, cache):
+        handler = cls._check(handler)
+        variables = calculate.variables(handler)
+        if calculate.Scope.active():
+            return cls._wrap(handler, cache, variables)
+        key = (id(cache), calculate.hash(handler), variables)
+        expression = cls._interned.get(key)
+        if expression is None or expression.closed:
+            expression = cls._wrap(handler, cache, variables)
+            cls._interned[key] = expression
+        elif not calculate.equal(expression._handler, handler):
+            expression = cls._wrap(handler, cache, variables)
+        return expression
 
     @property
     def token(self):
@@ -125,4 +207,153 @@ class Expression(ManagedClass):
         return variables.split(',') if variables else []
 
 
+class ExpressionGroup:
+
+    __slots__ = ('_expressions', '_unique', '_plan')
+
+    def __init__(self, *expressions):
+        if not expressions:
+            raise ValueError('Empty expression group')
+        variables = expressions[0].variables
+        for expression in expressions[1:]:
+            if expression.variables != variables:
+                raise ValueError(
+                    f'Mismatched variables: {expression.variables}'
+                    f' vs {variables}'
+                )
+        unique = {}
+        self._expressions = expressions
+        self._plan = tuple(
+            unique.setdefault(expression, len(unique))
+            for expression in expressions
+        )
+        self._unique = tuple(unique)
+
+    def __call__(self, *args):
+        values = [expression(*args) for expression in self._unique]
+        return tuple(values[index] for index in self._plan)
+
+    def __len__(self):
+        return len(self._expressions)
+
+    def __getitem__(self, index):
+        return self._expressions[index]
+
+    def __iter__(self):
+        return iter(self._expressions)
+
+    def __repr__(self):
+        name = self.__class__.__name__
+        return (
+            f"<{name} {{"
+            f"'expressions': {len(self._expressions)}, "
+            f"'unique': {len(self._unique)}, "
+            f"'variables': {repr(self.variables)}"
+            f"}}>"
+        )
+
+    @property
+    def variables(self):
+        return self._expressions[0].variables
+
+    def map(self, *arrays, out=None):
+        views = [buffer.doubles(array) for array in arrays]
+        rows, columns = buffer.size(views), len(self._expressions)
+        if out is None:
+            out = buffer.allocate(rows * columns, (rows, columns))
+        buffer.conform(out, (rows, columns))
+        output = buffer.doubles(out, writable=True)
+        for row, values in enumerate(buffer.evaluate(self, views)):
+            for column, value in enumerate(values):
+                output[row * columns + column] = value
+        return out
+
+
+class CachedExpression:
+
+    __slots__ = (
+        '_expression',
+        '_hash',
+        '_arguments',
+        '_maxsize',
+        '_enabled',
+        '_results',
+        '_hits',
+        '_misses'
+    )
+
+    def __init__(self, expression, maxsize=128):
+        self._expression = expression
+        self._hash = hash(expression)
+        self._arguments = expression._arguments
+        self._maxsize = maxsize
+        self._enabled = all(
+            getattr(wrapper, 'pure', False) for wrapper in expression._cache
+        )
+        self._results = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, *args):
+        if len(args) != self._arguments:
+            name = self.__class__.__name__
+            raise TypeError(
+                f"{name}() takes {self._arguments} positional arguments"
+                f" but {len(args)} were given"
+            )
+        if not self._enabled:
+            return self._expression(*args)
+        key = (self._hash, struct.pack(f'{len(args)}d', *args))
+        if key in self._results:
+            self._hits += 1
+            self._results.move_to_end(key)
+            return self._results[key]
+        self._misses += 1
+        result = self._expression(*args)
+        self._results[key] = result
+        if self._maxsize is not None and len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
+        return result
+
+    def __float__(self):
+        return self()
+
+    def __repr__(self):
+        name = self.__class__.__name__
+        return (
+            f"<{name} {{"
+            f"'expression': '{self._expression.infix}', "
+            f"'enabled': {self._enabled}, "
+            f"'hits': {self._hits}, "
+            f"'misses': {self._misses}"
+            f"}}>"
+        )
+
+    @property
+    def expression(self):
+        return self._expression
+
+    @property
+    def variables(self):
+        return self._expression.variables
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    def cache_info(self):
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'maxsize': self._maxsize,
+            'currsize': len(self._results),
+            'enabled': self._enabled
+        }
+
+    def cache_clear(self):
+        self._results.clear()
+        self._hits = 0
+        self._misses = 0
+
+
 Iterable.register(Expression)
@@ -0,0 +1,199 @@
+import math
+import sys
+
+__all__ = ['integrate', 'bisect', 'brentq', 'golden', 'brent']
+
+
+EPSILON = sys.float_info.epsilon
+GOLDEN = (3 - math.sqrt(5)) / 2
+TINY = 1e-10
+
+
+def _univariate(parser, expression, variable, bindings):
+    if bindings:
+        expression = parser.specialize(expression, bindings)
+    if expression.variables != [variable]:
+        raise ValueError(
+            f"Expression must depend on '{variable}' only"
+            f" once bound, found {expression.variables}"
+        )
+    return expression
+
+
+def _bracket(a, b, fa, fb):
+    if fa * fb > 0:
+        raise ValueError(f'Root not bracketed in [{a}, {b}]')
+
+
+def _converge(iterations):
+    raise RuntimeError(f'No convergence after {iterations} iterations')
+
+
+def integrate(
+        parser, expression, variable, a, b, bindings=None,
+        tolerance=1e-10, depth=50
+):
+    function = _univariate(parser, expression, variable, bindings)
+    fa, fm, fb = function(a), function((a + b) / 2), function(b)
+    whole = (b - a) * (fa + 4 * fm + fb) / 6
+    parts = []
+    stack = [(a, b, fa, fm, fb, whole, tolerance, depth)]
+    while stack:
+        a, b, fa, fm, fb, whole, tolerance, level = stack.pop()
+        m = (a + b) / 2
+        flm, frm = function((a + m) / 2), function((m + b) / 2)
+        left = (m - a) * (fa + 4 * flm + fm) / 6
+        right = (b - m) * (fm + 4 * frm + fb) / 6
+        delta = left + right - whole
+        if abs(delta) <= 15 * tolerance:
+            parts.append(left + right + delta / 15)
+        elif level <= 0:
+            raise RuntimeError(
+                f'No convergence on [{a}, {b}] after {depth} subdivisions'
+            )
+        else:
+            stack.append((a, m, fa, flm, fm, left, tolerance / 2, level - 1))
+            stack.append((m, b, fm, frm, fb, right, tolerance / 2, level - 1))
+    return math.fsum(parts)
+
+
+def bisect(
+        parser, expression, variable, a, b, bindings=None,
+        tolerance=1e-12, iterations=200
+):
+    function = _univariate(parser, expression, variable, bindings)
+    fa, fb = function(a), function(b)
+    _bracket(a, b, fa, fb)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    for _ in range(iterations):
+        m = (a + b) / 2
+        fm = function(m)
+        if fm == 0 or abs(b - a) / 2 <= tolerance:
+            return m
+        if fa * fm < 0:
+            b, fb = m, fm
+        else:
+            a, fa = m, fm
+    _converge(iterations)
+
+
+def brentq(
+        parser, expression, variable, a, b, bindings=None,
+        tolerance=1e-12, iterations=100
+):
+    function = _univariate(parser, expression, variable, bindings)
+    fa, fb = function(a), function(b)
+    _bracket(a, b, fa, fb)
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(iterations):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2 * EPSILON * abs(b) + tolerance / 2
+        m = (c - b) / 2
+        if abs(m) <= tol or fb == 0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * m * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            q = -q if p > 0 else q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = function(b)
+    _converge(iterations)
+
+
+def golden(
+        parser, expression, variable, a, b, bindings=None,
+        tolerance=1e-8, iterations=200
+):
+    function = _univariate(parser, expression, variable, bindings)
+    a, b = min(a, b), max(a, b)
+    c, d = a + GOLDEN * (b - a), b - GOLDEN * (b - a)
+    fc, fd = function(c), function(d)
+    for _ in range(iterations):
+        if b - a <= tolerance * (abs(c) + abs(d)) + TINY:
+            return (a + b) / 2
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = a + GOLDEN * (b - a)
+            fc = function(c)
+        else:
+            a, c, fc = c, d, fd
+            d = b - GOLDEN * (b - a)
+            fd = function(d)
+    _converge(iterations)
+
+
+def brent(
+        parser, expression, variable, a, b, bindings=None,
+        tolerance=1.5e-8, iterations=100
+):
+    function = _univariate(parser, expression, variable, bindings)
+    a, b = min(a, b), max(a, b)
+    x = w = v = a + GOLDEN * (b - a)
+    fx = fw = fv = function(x)
+    d = e = 0.
+    for _ in range(iterations):
+        m = (a + b) / 2
+        tol = tolerance * abs(x) + TINY
+        if abs(x - m) <= 2 * tol - (b - a) / 2:
+            return x
+        parabolic = False
+        if abs(e) > tol:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            p = -p if q > 0 else p
+            q = abs(q)
+            if (
+                    abs(p) < abs(q * e / 2) and
+                    q * (a - x) < p < q * (b - x)
+            ):
+                e, d = d, p / q
+                parabolic = True
+                if (x + d) - a < 2 * tol or b - (x + d) < 2 * tol:
+                    d = math.copysign(tol, m - x)
+        if not parabolic:
+            e = (a if x >= m else b) - x
+            d = GOLDEN * e
+        u = x + d if abs(d) >= tol else x + math.copysign(tol, d)
+        fu = function(u)
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+    _converge(iterations)
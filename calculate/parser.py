@@ -1,3 +1,9 @@
+from abc import abstractmethod
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+import struct
+
 from calculate.calculate import ManagedClass
 from calculate.symbol import ConstantFactory, FunctionFactory, OperatorFactory
 from calculate.expression import Expression
@@ -10,11 +16,20 @@ __all__ = ['Parser', 'DefaultParser']
 
 class BaseParser(ManagedClass):
 
-    def __init__(self, handler):
+    _specializations_size = 128
+
+    def __init__(self, handler, parent=None):
         super().__init__(handler)
-        self._constants = ConstantFactory(self._handler)
-        self._functions = FunctionFactory(self._handler)
-        self._operators = OperatorFactory(self._handler)
+        if parent is None:
+            self._constants = ConstantFactory(self._handler)
+            self._functions = FunctionFactory(self._handler)
+            self._operators = OperatorFactory(self._handler)
+        else:
+            self._constants = parent._constants.fork(self._handler)
+            self._functions = parent._functions.fork(self._handler)
+            self._operators = parent._operators.fork(self._handler)
+        self._snapshot = (None, frozenset())
+        self._specializations = WeakKeyDictionary()
 
     def __repr__(self):
         name = self.__class__.__name__
@@ -27,10 +42,18 @@ class BaseParser(ManagedClass):
         )
 
     def _backup(self):
-        cache = set()
-        cache |= self._functions.backup()
-        cache |= self._operators.backup()
-        return cache
+        version = (self._functions.version, self._operators.version)
+        if version != self._snapshot[0]:
+            self._snapshot = (
+                version,
+                self._functions.backup() | self._operators.backup()
+            )
+        return self._snapshot[1]
+
+    @staticmethod
+    @abstractmethod
+    def _spawn():
+        pass
 
     @property
     def constants(self):
@@ -44,6 +67,9 @@ class BaseParser(ManagedClass):
     def operators(self):
         return self._operators
 
+    def fork(self):
+        return self.__class__(parent=self)
+
     def cast(self, expression):
         return calculate.cast(self._handler, expression)
 
@@ -56,7 +82,7 @@ class BaseParser(ManagedClass):
         expressions = calculate.get_nodes()
         for index, node in enumerate(nodes):
             expressions = calculate.insert_node(expressions, node._handler)
-        return Expression(
+        return Expression.intern(
             calculate.create_node(
                 self._handler,
                 token,
@@ -67,14 +93,14 @@ class BaseParser(ManagedClass):
         )
 
     def from_value(self, value):
-        return Expression(
+        return Expression.intern(
             calculate.from_value(self._handler, value),
             self._backup()
         )
 
     def from_infix(self, expression, variables=None):
         variables = [] if variables is None else variables
-        return Expression(
+        return Expression.intern(
             calculate.from_infix(
                 self._handler,
                 expression,
@@ -85,7 +111,7 @@ class BaseParser(ManagedClass):
 
     def from_postfix(self, expression, variables=None):
         variables = [] if variables is None else variables
-        return Expression(
+        return Expression.intern(
             calculate.from_postfix(
                 self._handler,
                 expression,
@@ -95,13 +121,13 @@ class BaseParser(ManagedClass):
         )
 
     def parse(self, expression):
-        return Expression(
+        return Expression.intern(
             calculate.parse(self._handler, expression),
             self._backup()
         )
 
     def variables(self, node, variables):
-        return Expression(
+        return Expression.intern(
             calculate.new_variables(
                 self._handler,
                 node._handler,
@@ -111,14 +137,14 @@ class BaseParser(ManagedClass):
         )
 
     def optimize(self, node):
-        return Expression(
+        return Expression.intern(
             calculate.optimize(self._handler, node._handler),
             self._backup()
         )
 
     def replace(self, one, branch, another, variables=None):
         variables = one.variables() if variables is None else variables
-        return Expression(
+        return Expression.intern(
             calculate.replace(
                 self._handler,
                 one._handler,
@@ -130,7 +156,7 @@ class BaseParser(ManagedClass):
         )
 
     def substitute(self, node, variable, value):
-        return Expression(
+        return Expression.intern(
             calculate.substitute(
                 self._handler,
                 node._handler,
@@ -140,14 +166,59 @@ class BaseParser(ManagedClass):
             self._backup()
         )
 
+    def specialize(self, node, values):
+        versions = (
+            self._constants.version,
+            self._functions.version,
+            self._operators.version
+        )
+        key = tuple(sorted(
+            (variable, struct.pack('d', value))
+            for variable, value in values.items()
+        ))
+        memo, specializations = self._specializations.get(node, (None, None))
+        if memo != versions:
+            specializations = OrderedDict()
+            self._specializations[node] = (versions, specializations)
+        expression = specializations.get(key)
+        if expression is not None and not expression.closed:
+            specializations.move_to_end(key)
+            return expression
+        handler = node._handler
+        for variable, value in key:
+            handler = calculate.substitute(
+                self._handler,
+                handler,
+                variable,
+                struct.unpack('d', value)[0]
+            )
+        expression = Expression.intern(
+            calculate.optimize(self._handler, handler),
+            self._backup()
+        )
+        if not calculate.Scope.active():
+            specializations[key] = expression
+            specializations.move_to_end(key)
+            if len(specializations) > self._specializations_size:
+                specializations.popitem(last=False)
+        return expression
+
 
 class Parser(BaseParser):
 
-    def __init__(self):
-        super().__init__(calculate.get_parser())
+    def __init__(self, parent=None):
+        super().__init__(self._spawn(), parent)
+
+    @staticmethod
+    def _spawn():
+        return calculate.get_parser()
 
 
 class DefaultParser(BaseParser):
 
-    def __init__(self):
-        super().__init__(calculate.get_default_parser())
+    def __init__(self, parent=None):
+        super().__init__(self._spawn(), parent)
+
+    @staticmethod
+    def _spawn():
+        return calculate.get_default_parser()
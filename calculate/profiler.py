@@ -0,0 +1,115 @@
+from collections import defaultdict
+
+import json
+import time
+
+from calculate.calculate import Symbol
+
+__all__ = ['Profile', 'profile']
+
+
+SPEEDSCOPE_SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+
+class Profile:
+
+    __slots__ = ('_nodes', '_repeat')
+
+    def __init__(self, nodes, repeat):
+        self._nodes = tuple(nodes)
+        self._repeat = repeat
+
+    def __repr__(self):
+        name = self.__class__.__name__
+        return (
+            f"<{name} {{"
+            f"'nodes': {len(self._nodes)}, "
+            f"'repeat': {self._repeat}, "
+            f"'total': {self.total}"
+            f"}}>"
+        )
+
+    @property
+    def nodes(self):
+        return [dict(node) for node in self._nodes]
+
+    @property
+    def repeat(self):
+        return self._repeat
+
+    @property
+    def total(self):
+        return self._nodes[0]['cumulative'] if self._nodes else 0.
+
+    @property
+    def tokens(self):
+        tokens = defaultdict(lambda: {'self': 0., 'calls': 0})
+        for node in self._nodes:
+            if node['symbol'] in (Symbol.FUNCTION, Symbol.OPERATOR):
+                tokens[node['token']]['self'] += node['self']
+                tokens[node['token']]['calls'] += node['calls']
+        return dict(tokens)
+
+    def collapsed(self):
+        return '\n'.join(
+            f"{';'.join(node['stack'])} {round(node['self'] * 1e6)}"
+            for node in self._nodes
+        )
+
+    def speedscope(self, name='calculate'):
+        frames, indices, samples = [], {}, []
+        for node in self._nodes:
+            for frame in node['stack']:
+                if frame not in indices:
+                    indices[frame] = len(frames)
+                    frames.append({'name': frame})
+            samples.append([indices[frame] for frame in node['stack']])
+        return json.dumps({
+            '$schema': SPEEDSCOPE_SCHEMA,
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0.,
+                'endValue': self.total,
+                'samples': samples,
+                'weights': [node['self'] for node in self._nodes]
+            }]
+        })
+
+
+def _time(node, args, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        node(*args)
+    return time.perf_counter() - start
+
+
+def profile(expression, args, repeat=1000):
+    nodes = []
+
+    def walk(node, stack):
+        stack = (*stack, node.token)
+        record = {
+            'stack': stack,
+            'token': node.token,
+            'symbol': node.symbol,
+            'calls': repeat,
+            'cumulative': _time(node, args, repeat)
+        }
+        nodes.append(record)
+        record['children'] = [walk(child, stack) for child in node]
+        return record
+
+    walk(expression, ())
+    overhead = min(
+        node['cumulative'] for node in nodes if not node['children']
+    )
+    for node in nodes:
+        node['cumulative'] = max(node['cumulative'] - overhead, 0.)
+    for node in nodes:
+        node['self'] = max(node['cumulative'] - sum(
+            child['cumulative'] for child in node.pop('children')
+        ), 0.)
+    return Profile(nodes, repeat)
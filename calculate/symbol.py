@@ -1,11 +1,11 @@
 from collections import Iterable, MutableMapping
-from types import MethodType
 
-import functools
+import copy
 import inspect
 
 from calculate.calculate import ManagedClass, ffi
 
+import calculate.buffer as buffer
 import calculate.exception as exception
 import calculate.calculate as calculate
 
@@ -20,30 +20,38 @@ __all__ = [
 
 class Function(ManagedClass):
 
+    __slots__ = ('_arguments',)
+
     def __init__(self, handler):
         super().__init__(handler)
-        self._error = calculate.Error()
-
-        evaluate = {
-            1: lambda self, x0:
-                calculate.evaluate_function(self._handler, 1, x0, 0., 0.),
-            2: lambda self, x0, x1:
-                calculate.evaluate_function(self._handler, 2, x0, x1, 0.),
-            3: lambda self, x0, x1, x2:
-                calculate.evaluate_function(self._handler, 3, x0, x1, x2)
-        }[self.arguments]
-        evaluate = MethodType(functools.wraps(self._evaluate)(evaluate), self)
-        setattr(self, '_evaluate', evaluate)
+        self._arguments = self.arguments
 
     def __call__(self, *args):
-        return self._evaluate(*args)
+        if len(args) != self._arguments:
+            name = self.__class__.__name__
+            raise TypeError(
+                f"{name}() takes {self._arguments} positional arguments"
+                f" but {len(args)} were given"
+            )
+        return calculate.evaluate_function(
+            self._handler,
+            len(args),
+            *args,
+            *(0.,) * (3 - len(args))
+        )
 
     def __repr__(self):
         name = self.__class__.__name__
         return f"<{name} {{'arguments': {self.arguments}}}>"
 
-    def _evaluate(self):
-        pass
+    def map(self, *arrays, out=None):
+        if len(arrays) != self._arguments:
+            name = self.__class__.__name__
+            raise TypeError(
+                f"{name}.map() takes {self._arguments} buffers"
+                f" but {len(arrays)} were given"
+            )
+        return buffer.apply(self, arrays, out)
 
     @property
     def arguments(self):
@@ -52,6 +60,8 @@ class Function(ManagedClass):
 
 class Operator(ManagedClass):
 
+    __slots__ = ()
+
     def __init__(self, handler):
         super().__init__(handler)
 
@@ -65,6 +75,9 @@ class Operator(ManagedClass):
             f"}}>"
         )
 
+    def map(self, *arrays, out=None):
+        return self.function.map(*arrays, out=out)
+
     @property
     def alias(self):
         return calculate.alias(self._handler)
@@ -84,49 +97,44 @@ class Operator(ManagedClass):
 
 class SymbolFactory(MutableMapping):
 
-    class LazyEvaluator:
-
-        def __init__(self, parser, token, cls, kind):
-            self._parser = parser
-            self._token = token
-            self._class = cls
-            self._kind = kind
-
-        def do(self):
-            return self._class(
-                getattr(calculate, f'get_{self._kind}')
-                (self._parser, self._token)
-            )
-
     def __init__(self, parser, cls, kind):
         calculate.check_parser(parser)
         self._parser = parser
         self._class = cls
         self._kind = kind
-        self._factory = {
-            token: self.LazyEvaluator(parser, token, cls, kind)
-            for token in
+        self._version = 0
+        self._shared = False
+        self._journal = {}
+        self._factory = dict.fromkeys(
+            token for token in
             getattr(calculate, f'list_{self._kind}s')(self._parser).split(',')
             if token
-        }
+        )
+        self._origin = frozenset(self._factory)
 
     def __getitem__(self, key):
         key = self.__keytransform__(key)
-        if key in self._factory:
-            return self._factory[key].do()
-        else:
-            return getattr(calculate, f'get_{self._kind}')(self._parser, key)
+        symbol = getattr(calculate, f'get_{self._kind}')(self._parser, key)
+        return self._class(symbol) if key in self._factory else symbol
 
     def __setitem__(self, key, value):
         key = self.__keytransform__(key)
-        getattr(calculate, f'set_{self._kind}')(self._parser, key, value)
-        self._factory[key] = \
-            self.LazyEvaluator(self._parser, key, self._class, self._kind)
+        self._store(key, value)
+        self._own()
+        self._factory[key] = None
+        self._journal.pop(key, None)
+        self._journal[key] = ('set', value)
+        self._version += 1
 
     def __delitem__(self, key):
         key = self.__keytransform__(key)
-        getattr(calculate, f'remove_{self._kind}')(self._parser, key)
+        self._remove(key)
+        self._own()
         del self._factory[key]
+        self._journal.pop(key, None)
+        if key in self._origin:
+            self._journal[key] = ('remove', None)
+        self._version += 1
 
     def __iter__(self):
         return iter(self._factory)
@@ -142,6 +150,37 @@ class SymbolFactory(MutableMapping):
         name = self.__class__.__name__
         return f"<{name} {keys}>"
 
+    def _store(self, key, value):
+        getattr(calculate, f'set_{self._kind}')(self._parser, key, value)
+
+    def _remove(self, key):
+        getattr(calculate, f'remove_{self._kind}')(self._parser, key)
+
+    def _own(self):
+        if self._shared:
+            self._factory = dict(self._factory)
+            self._journal = dict(self._journal)
+            self._shared = False
+
+    def _replay(self):
+        for key, (action, value) in self._journal.items():
+            if action == 'set':
+                self._store(key, value)
+            else:
+                self._remove(key)
+
+    @property
+    def version(self):
+        return self._version
+
+    def fork(self, parser):
+        calculate.check_parser(parser)
+        child = copy.copy(self)
+        child._parser = parser
+        self._shared = child._shared = True
+        child._replay()
+        return child
+
 
 class CallableFactory(SymbolFactory):
 
@@ -149,26 +188,36 @@ class CallableFactory(SymbolFactory):
         super().__init__(parser, cls, kind)
         self._builtins = dict(self._factory)
         self._cache = {}
+        self._snapshot = (self._version, frozenset())
 
     def __setitem__(self, key, value):
         key = self.__keytransform__(key)
         if not isinstance(value, Iterable):
             value = [value]
-        if key in self._builtins:
-            del self._builtins[key]
-        wrapper = self.Wrapper(self._parser, self._kind, key, *value)
-        self._cache[key] = wrapper
-        self._factory[key] = \
-            self.LazyEvaluator(self._parser, key, self._class, self._kind)
+        super().__setitem__(key, value)
+        self._builtins.pop(key, None)
 
     def __delitem__(self, key):
         key = self.__keytransform__(key)
-        if key not in self._builtins:
-            if key in self._cache:
-                del self._cache[key]
-        else:
-            del self._builtins[key]
         super().__delitem__(key)
+        self._builtins.pop(key, None)
+
+    def _store(self, key, value):
+        self._cache[key] = self.Wrapper(self._parser, self._kind, key, *value)
+
+    def _remove(self, key):
+        super()._remove(key)
+        self._cache.pop(key, None)
+
+    def _own(self):
+        if self._shared:
+            self._builtins = dict(self._builtins)
+        super()._own()
+
+    def _replay(self):
+        self._cache = {}
+        self._snapshot = (None, frozenset())
+        super()._replay()
 
     @staticmethod
     def parameters(function):
@@ -178,7 +227,11 @@ class CallableFactory(SymbolFactory):
         )
 
     def backup(self):
-        return set(self._cache.values())
+        version, snapshot = self._snapshot
+        if version != self._version:
+            snapshot = frozenset(self._cache.values())
+            self._snapshot = (self._version, snapshot)
+        return snapshot
 
 
 class ConstantFactory(SymbolFactory):
@@ -193,12 +246,13 @@ class FunctionFactory(CallableFactory):
 
         def __init__(self, parser, kind, token, *args):
             name = self.__class__.__name__
-            if len(args) != 1:
+            if not 0 < len(args) < 3:
                 raise TypeError(
-                    f"{name}() takes 1 positional argument"
+                    f"{name}() takes from 1 to 2 positional arguments"
                     f" but {len(args)} were given"
                 )
-            self._function = args[-1]
+            self._function = args[0]
+            self._pure = bool(args[1]) if len(args) > 1 else False
             self._handler = ffi.new_handle(self)
 
             arguments = CallableFactory.parameters(self._function)
@@ -219,6 +273,10 @@ class FunctionFactory(CallableFactory):
         def function(self):
             return self._function
 
+        @property
+        def pure(self):
+            return self._pure
+
     def __init__(self, parser):
         super().__init__(parser, Function, 'function')
 
@@ -229,12 +287,13 @@ class OperatorFactory(CallableFactory):
 
         def __init__(self, parser, kind, token, *args):
             name = self.__class__.__name__
-            if len(args) != 4:
+            if not 3 < len(args) < 6:
                 raise TypeError(
-                    f"{name}() takes 4 positional arguments"
+                    f"{name}() takes from 4 to 5 positional arguments"
                     f" but {len(args)} were given"
                 )
-            self._function = args[-1]
+            self._function = args[3]
+            self._pure = bool(args[4]) if len(args) > 4 else False
             self._handler = ffi.new_handle(self)
 
             arguments = CallableFactory.parameters(self._function)
@@ -247,7 +306,7 @@ class OperatorFactory(CallableFactory):
                 parser,
                 token,
                 self._handler,
-                *args[:-1],
+                *args[:3],
                 calculate.lib._calculate_callback2
             )
 
@@ -255,6 +314,10 @@ class OperatorFactory(CallableFactory):
         def function(self):
             return self._function
 
+        @property
+        def pure(self):
+            return self._pure
+
     def __init__(self, parser):
         super().__init__(parser, Operator, 'operator')
 
@@ -0,0 +1,22 @@
+import pytest
+
+
+class Univariate:
+
+    def __init__(self, function, variable='x'):
+        self._function = function
+        self.variables = [variable]
+        self.sizes = []
+
+    def __call__(self, x):
+        return self._function(x)
+
+    def map(self, *arrays, out=None):
+        import calculate.buffer as buffer
+        self.sizes.append(len(arrays[0]))
+        return buffer.apply(self, arrays, out)
+
+
+@pytest.fixture
+def univariate():
+    return Univariate
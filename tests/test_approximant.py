@@ -0,0 +1,60 @@
+from array import array
+
+import math
+
+import pytest
+
+pytest.importorskip('calculate._calculate')
+
+from calculate.approximant import chebyshev
+
+
+def test_chebyshev(univariate):
+    function = univariate(lambda x: math.exp(math.sin(x)))
+    approximant = chebyshev(function, (0, 3), 1e-10)
+    assert approximant.error <= 1e-10
+    assert approximant.variables == ['x']
+    for x in (0., .7, 1.5, 3.):
+        assert approximant(x) == pytest.approx(function(x), abs=1e-10)
+
+
+def test_chebyshev_map(univariate):
+    approximant = chebyshev(univariate(math.cos), (-1, 1), 1e-12)
+    result = approximant.map(array('d', [-1., 0., .5]))
+    assert result.tolist() == pytest.approx(
+        [math.cos(-1.), 1., math.cos(.5)], abs=1e-12
+    )
+
+
+def test_chebyshev_polynomial_degree(univariate):
+    approximant = chebyshev(univariate(lambda x: x ** 3 - x), (-2, 2), 1e-12)
+    assert approximant.degree == 3
+
+
+def test_chebyshev_outside_domain(univariate):
+    approximant = chebyshev(univariate(math.exp), (0, 1), 1e-8)
+    with pytest.raises(ValueError):
+        approximant(1.5)
+
+
+def test_chebyshev_degree_limit(univariate):
+    function = univariate(abs)
+    with pytest.raises(ValueError):
+        chebyshev(function, (-1, 1), 1e-12, degree=64)
+    assert function.sizes[::2] == [8, 16, 32, 64, 65]
+
+
+@pytest.mark.parametrize('domain, degree', [((1, 1), 8), ((0, 1), -1)])
+def test_chebyshev_invalid(domain, degree, univariate):
+    with pytest.raises(ValueError):
+        chebyshev(univariate(math.exp), domain, 1e-8, degree)
+
+
+def test_chebyshev_samples_within_domain(univariate):
+    domain = (-7.664800500244866, 0.1638815128749025)
+    try:
+        approximant = chebyshev(univariate(math.sin), domain, 1e-10, degree=19)
+    except ValueError as error:
+        assert 'Tolerance' in str(error)
+    else:
+        assert approximant(domain[1]) == pytest.approx(math.sin(domain[1]))
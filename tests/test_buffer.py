@@ -0,0 +1,182 @@
+from array import array
+
+import ctypes
+import math
+
+import pytest
+
+pytest.importorskip('calculate._calculate')
+
+import calculate.buffer as buffer
+
+
+NAN = float('nan')
+
+
+def values(*items):
+    return iter(items)
+
+
+def test_apply():
+    result = buffer.apply(
+        lambda x, y: x * y,
+        [array('d', [1, 2, 3]), array('d', [4, 5, 6])]
+    )
+    assert result.tolist() == [4., 10., 18.]
+
+
+def test_apply_into_output():
+    out = array('d', [0.] * 2)
+    assert buffer.apply(lambda x: -x, [array('d', [1, 2])], out) is out
+    assert out.tolist() == [-1., -2.]
+
+
+def test_apply_empty():
+    assert buffer.apply(lambda x: x, [array('d')]).tolist() == []
+
+
+def test_apply_mismatched_sizes():
+    with pytest.raises(ValueError):
+        buffer.apply(lambda x, y: x, [array('d', [1]), array('d', [1, 2])])
+
+
+def test_apply_wrong_format():
+    with pytest.raises(TypeError):
+        buffer.apply(lambda x: x, [array('i', [1, 2])])
+
+
+@pytest.mark.parametrize('operation, expected', [
+    ('sum', 10.),
+    ('mean', 2.5),
+    ('min', 1.),
+    ('max', 4.),
+    ('argmin', 1),
+    ('argmax', 2)
+])
+def test_reduce(operation, expected):
+    assert buffer.reduce(operation, values(3., 1., 4., 2.)) == expected
+
+
+def test_reduce_compensated():
+    assert buffer.reduce('sum', values(1e16, 1., -1e16)) == 0.
+    assert buffer.reduce('sum', values(1e16, 1., -1e16), compensated=True) \
+        == 1.
+
+
+@pytest.mark.parametrize('operation', ['min', 'max', 'argmin', 'argmax'])
+def test_reduce_nan(operation):
+    result = buffer.reduce(operation, values(3., NAN, 1., 5.))
+    if operation.startswith('arg'):
+        assert result == 1
+    else:
+        assert math.isnan(result)
+
+
+@pytest.mark.parametrize('operation', ['mean', 'min', 'argmax'])
+def test_reduce_empty(operation):
+    with pytest.raises(ValueError):
+        buffer.reduce(operation, values())
+
+
+def test_reduce_thresholds():
+    assert buffer.reduce('any', values(1., 4.), threshold=3.)
+    assert not buffer.reduce('all', values(1., 4.), threshold=3.)
+    assert buffer.reduce('all', values(1., 2.), threshold=3., comparison='<')
+    assert not buffer.reduce('any', values(0., 0.))
+
+
+def test_reduce_early_exit():
+    consumed = []
+
+    def generate():
+        for value in (1., 5., 2., 3.):
+            consumed.append(value)
+            yield value
+
+    assert buffer.reduce('any', generate(), threshold=4.)
+    assert consumed == [1., 5.]
+
+
+def test_reduce_unknown():
+    with pytest.raises(ValueError):
+        buffer.reduce('median', values(1.))
+    with pytest.raises(ValueError):
+        buffer.reduce('any', values(1.), threshold=0., comparison='=>')
+
+
+
+def test_reduce_compensated_infinities():
+    inf = float('inf')
+    assert math.isnan(
+        buffer.reduce('sum', values(-inf, 1., inf), compensated=True)
+    )
+    assert buffer.reduce('sum', values(1., inf, 2.), compensated=True) == inf
+    assert buffer.reduce('mean', values(-inf, 1.), compensated=True) == -inf
+    assert math.isnan(
+        buffer.reduce('sum', values(1., NAN), compensated=True)
+    )
+
+
+@pytest.mark.parametrize('operation, options', [
+    ('sum', {'threshold': 0.}),
+    ('mean', {'comparison': '<'}),
+    ('max', {'threshold': 1., 'comparison': '>='}),
+    ('any', {'comparison': '<'}),
+    ('min', {'compensated': True}),
+    ('argmax', {'compensated': True}),
+    ('all', {'threshold': 0., 'compensated': True})
+])
+def test_reduce_unused_options(operation, options):
+    with pytest.raises(ValueError):
+        buffer.reduce(operation, values(1., 2.), **options)
+
+
+def test_grid():
+    result = buffer.grid(
+        lambda x, y: 10 * x + y,
+        [array('d', [1, 2]), array('d', [3, 4, 5])]
+    )
+    assert result.shape == (2, 3)
+    assert result.tolist() == [[13., 14., 15.], [23., 24., 25.]]
+
+
+def test_grid_without_axes():
+    assert buffer.grid(lambda: 3., []).tolist() == [3.]
+
+
+def test_grid_empty():
+    result = buffer.grid(
+        lambda x, y: x + y,
+        [array('d', [1, 2]), array('d')]
+    )
+    assert result.tolist() == []
+
+
+def test_grid_output_shape():
+    axes = [array('d', [1, 2]), array('d', [3, 4, 5])]
+    with pytest.raises(ValueError):
+        buffer.grid(lambda x, y: x, axes, array('d', [0.] * 6))
+    out = buffer.allocate(6, (2, 3))
+    assert buffer.grid(lambda x, y: x, axes, out) is out
+
+
+def test_grid_shaped_axis():
+    with pytest.raises(ValueError):
+        buffer.grid(lambda x: x, [buffer.allocate(4, (2, 2))])
+
+
+def test_grid_empty_output():
+    axes = [array('d'), array('d', [1, 2, 3, 4, 5])]
+    out = (ctypes.c_double * 5 * 0)()
+    assert buffer.grid(lambda x, y: x, axes, out) is out
+    out = array('d')
+    assert buffer.grid(lambda x, y: x, axes, out) is out
+    with pytest.raises(ValueError):
+        buffer.grid(lambda x, y: x, axes, (ctypes.c_double * 0 * 5)())
+
+
+def test_native_doubles():
+    out = (ctypes.c_double * 3 * 2)()
+    axes = [array('d', [1, 2]), array('d', [3, 4, 5])]
+    buffer.grid(lambda x, y: 10 * x + y, axes, out)
+    assert [list(row) for row in out] == [[13., 14., 15.], [23., 24., 25.]]
@@ -0,0 +1,133 @@
+from array import array
+
+import math
+
+import pytest
+
+pytest.importorskip('calculate._calculate')
+
+import calculate
+
+
+@pytest.fixture
+def parser():
+    return calculate.DefaultParser()
+
+
+def test_interned_expressions_are_shared(parser):
+    one = parser.from_infix('x + 1', ['x'])
+    another = parser.from_infix('x + 1', ['x'])
+    assert one is another
+    assert one == another
+
+
+def test_close_shared_expression(parser):
+    expression = parser.from_infix('x + 1', ['x'])
+    for value in range(3):
+        assert parser.from_infix('x + 1', ['x'])(value) == value + 1
+    expression.close()
+    assert expression.closed
+    with pytest.raises(ValueError):
+        expression(1.)
+    fresh = parser.from_infix('x + 1', ['x'])
+    assert fresh is not expression
+    assert not fresh.closed
+    assert fresh(1.) == 2.
+
+
+def test_close_with_block(parser):
+    with parser.from_infix('x * 2', ['x']) as expression:
+        assert expression(3.) == 6.
+    assert expression.closed
+
+
+def test_closed_specialization_is_rebuilt(parser):
+    expression = parser.from_infix('x * y', ['x', 'y'])
+    specialized = parser.specialize(expression, {'y': 2.})
+    assert parser.specialize(expression, {'y': 2.}) is specialized
+    specialized.close()
+    rebuilt = parser.specialize(expression, {'y': 2.})
+    assert rebuilt is not specialized
+    assert rebuilt(3.) == 6.
+
+
+def test_scope_expressions_are_private(parser):
+    shared = parser.from_infix('x - 1', ['x'])
+    with calculate.scope() as scope:
+        scoped = parser.from_infix('x - 1', ['x'])
+        assert scoped is not shared
+        assert scope.live
+    assert scoped.closed
+    assert not shared.closed
+    assert shared(1.) == 0.
+
+
+def test_group_map_output_shape(parser):
+    group = calculate.ExpressionGroup(
+        parser.from_infix('x + 1', ['x']),
+        parser.from_infix('x * 2', ['x'])
+    )
+    inputs = array('d', [1., 2., 3.])
+    result = group.map(inputs)
+    assert result.shape == (3, 2)
+    assert result.tolist() == [[2., 2.], [3., 4.], [4., 6.]]
+    transposed = calculate.buffer.allocate(6, (2, 3))
+    with pytest.raises(ValueError):
+        group.map(inputs, out=transposed)
+    with pytest.raises(ValueError):
+        group.map(inputs, out=array('d', [0.] * 6))
+
+
+def test_cached_eviction_order(parser):
+    cached = parser.from_infix('x + 1', ['x']).cached(maxsize=2)
+    assert cached(1.) == 2.
+    assert cached(2.) == 3.
+    assert cached(1.) == 2.
+    assert cached(3.) == 4.
+    assert cached.cache_info()['hits'] == 1
+    assert cached(1.) == 2.
+    assert cached.cache_info()['hits'] == 2
+    assert cached(2.) == 3.
+    info = cached.cache_info()
+    assert (info['hits'], info['misses'], info['currsize']) == (2, 4, 2)
+
+
+def test_cached_signed_zeros(parser):
+    cached = parser.from_infix('x * 1', ['x']).cached()
+    assert math.copysign(1., cached(0.)) == 1.
+    assert math.copysign(1., cached(-0.)) == -1.
+    assert cached.cache_info()['misses'] == 2
+
+
+def test_cached_pure_callbacks(parser):
+    parser.functions['g'] = (lambda x: 2 * x, True)
+    cached = parser.from_infix('g(x) + 1', ['x']).cached()
+    assert cached.enabled
+    cached(1.)
+    cached(1.)
+    assert cached.cache_info()['hits'] == 1
+
+
+def test_cached_disabled_by_impure_callback(parser):
+    calls = []
+
+    def h(x):
+        calls.append(x)
+        return x
+
+    parser.functions['g'] = (lambda x: 2 * x, True)
+    parser.functions['h'] = h
+    cached = parser.from_infix('g(x) + h(x)', ['x']).cached()
+    assert not cached.enabled
+    assert cached(1.) == cached(1.) == 3.
+    assert calls == [1., 1.]
+    assert cached.cache_info()['hits'] == 0
+
+
+def test_cached_arity(parser):
+    cached = parser.from_infix('x * y', ['x', 'y']).cached()
+    with pytest.raises(TypeError):
+        cached(1.)
+    with pytest.raises(TypeError):
+        cached(1., 2., 3.)
+    assert cached.cache_info()['misses'] == 0
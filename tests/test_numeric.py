@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+pytest.importorskip('calculate._calculate')
+
+import calculate.numeric as numeric
+
+
+def test_integrate_polynomial(univariate):
+    result = numeric.integrate(None, univariate(lambda x: x ** 3), 'x', 0, 2)
+    assert result == pytest.approx(4., abs=1e-10)
+
+
+def test_integrate_gaussian(univariate):
+    result = numeric.integrate(
+        None, univariate(lambda x: math.exp(-x * x)), 'x', -6, 6
+    )
+    assert result == pytest.approx(math.sqrt(math.pi), abs=1e-9)
+
+
+def test_integrate_reversed_interval(univariate):
+    result = numeric.integrate(None, univariate(math.sin), 'x', math.pi, 0)
+    assert result == pytest.approx(-2., abs=1e-9)
+
+
+@pytest.mark.parametrize('solver', [numeric.bisect, numeric.brentq])
+def test_roots(solver, univariate):
+    expression = univariate(lambda x: x * x - 2)
+    assert solver(None, expression, 'x', 0, 2) == \
+        pytest.approx(math.sqrt(2), abs=1e-11)
+    expression = univariate(lambda x: math.cos(x) - x)
+    assert solver(None, expression, 'x', 0, 1) == \
+        pytest.approx(0.7390851332151607, abs=1e-11)
+
+
+@pytest.mark.parametrize('solver', [numeric.bisect, numeric.brentq])
+def test_root_on_bound(solver, univariate):
+    assert solver(None, univariate(lambda x: x - 1), 'x', 1, 3) == 1
+
+
+@pytest.mark.parametrize('solver', [numeric.bisect, numeric.brentq])
+def test_unbracketed_root(solver, univariate):
+    with pytest.raises(ValueError):
+        solver(None, univariate(lambda x: x * x + 1), 'x', -1, 1)
+
+
+@pytest.mark.parametrize('solver', [numeric.bisect, numeric.brentq])
+def test_root_without_convergence(solver, univariate):
+    with pytest.raises(RuntimeError):
+        solver(
+            None, univariate(lambda x: math.cos(x) - x), 'x', 0, 1,
+            tolerance=0., iterations=2
+        )
+
+
+@pytest.mark.parametrize('solver', [numeric.golden, numeric.brent])
+def test_minima(solver, univariate):
+    expression = univariate(lambda x: (x - 1.3) ** 2 + 1)
+    assert solver(None, expression, 'x', -4, 5) == \
+        pytest.approx(1.3, abs=1e-6)
+    assert solver(None, univariate(math.cos), 'x', 5, 2) == \
+        pytest.approx(math.pi, abs=1e-6)
+
+
+@pytest.mark.parametrize('solver', [numeric.golden, numeric.brent])
+def test_minimum_without_convergence(solver, univariate):
+    with pytest.raises(RuntimeError):
+        solver(
+            None, univariate(lambda x: x * x), 'x', -1, 2,
+            tolerance=0., iterations=2
+        )
+
+
+def test_wrong_variable(univariate):
+    with pytest.raises(ValueError):
+        numeric.integrate(None, univariate(math.sin, 'y'), 'x', 0, 1)
+
+
+def test_integrate_without_convergence(univariate):
+    with pytest.raises(RuntimeError):
+        numeric.integrate(
+            None, univariate(math.sin), 'x', 0, 50, tolerance=1e-14, depth=2
+        )
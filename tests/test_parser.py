@@ -0,0 +1,74 @@
+import math
+
+import pytest
+
+pytest.importorskip('calculate._calculate')
+
+import calculate
+
+
+@pytest.fixture
+def parser():
+    return calculate.DefaultParser()
+
+
+def test_fork_shares_symbols(parser):
+    parser.constants['k'] = 2.
+    child = parser.fork()
+    assert isinstance(child, calculate.DefaultParser)
+    assert set(child.constants) == set(parser.constants)
+    assert float(child.from_infix('k')) == 2.
+
+
+def test_fork_mutations_are_independent(parser):
+    parser.constants['a'] = 1.
+    child = parser.fork()
+    child.constants['a'] = 2.
+    parser.constants['b'] = 3.
+    child.functions['twice'] = lambda x: 2 * x
+    assert 'b' not in child.constants
+    assert 'twice' not in parser.functions
+    assert float(parser.from_infix('a')) == 1.
+    assert float(child.from_infix('a')) == 2.
+    assert float(child.from_infix('twice(a)')) == 4.
+    with pytest.raises(calculate.exception.BaseError):
+        parser.from_infix('twice(a)')
+
+
+def test_fork_of_fork(parser):
+    parser.constants['a'] = 1.
+    child = parser.fork()
+    child.constants['b'] = 2.
+    grandchild = child.fork()
+    assert float(grandchild.from_infix('a + b')) == 3.
+    assert 'b' not in parser.constants
+
+
+def test_remove_then_set_builtin(parser):
+    del parser.functions['sin']
+    assert 'sin' not in parser.functions
+    parser.functions['sin'] = math.cos
+    assert parser.functions._journal == {'sin': ('set', [math.cos])}
+    child = parser.fork()
+    assert 'sin' in child.functions
+    assert float(child.from_infix('sin(0)')) == 1.
+    assert float(parser.from_infix('sin(0)')) == 1.
+
+
+def test_removed_builtin_stays_removed_in_fork(parser):
+    del parser.functions['cos']
+    child = parser.fork()
+    assert 'cos' not in child.functions
+    with pytest.raises(calculate.exception.BaseError):
+        child.from_infix('cos(0)')
+
+
+def test_journal_keeps_latest_action(parser):
+    first, second = (lambda x: x), (lambda x: -x)
+    parser.functions['f'] = first
+    parser.functions['f'] = second
+    assert parser.functions._journal == {'f': ('set', [second])}
+    assert float(parser.fork().from_infix('f(1)')) == -1.
+    del parser.functions['f']
+    assert 'f' not in parser.functions._journal
+    assert 'f' not in parser.fork().functions